@@ -1,8 +1,9 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
-import copy
+import dataclasses
 import logging
+from typing import Final
 
 from homeassistant.components import mqtt
 from homeassistant.components.binary_sensor import DOMAIN, BinarySensorEntity
@@ -27,6 +28,17 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities are updated via MQTT push, so no update semaphore is needed.
+PARALLEL_UPDATES = 0
+
+# Binary sensor descriptions and device name per device type
+_BINARY_SENSORS_PER_DEVICETYPE: Final = {
+    "chargepoint": (BINARY_SENSORS_PER_CHARGEPOINT, "Chargepoint"),
+    "counter": (BINARY_SENSORS_PER_COUNTER, "Counter"),
+    "bat": (BINARY_SENSORS_PER_BATTERY, "Battery"),
+    "pv": (BINARY_SENSORS_PER_PVGENERATOR, "PV"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -39,52 +51,12 @@ async def async_setup_entry(
 
     sensorList = []
 
-    if devicetype == "chargepoint":
-        # Create sensors for chargepoint
-        BINARY_SENSORS_PER_CHARGEPOINT_CP = copy.deepcopy(
-            BINARY_SENSORS_PER_CHARGEPOINT
-        )
-
-        for description in BINARY_SENSORS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
-            )
-            _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
-
-            sensorList.append(
-                openwbBinarySensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=f"Chargepoint {deviceID}",
-                    mqtt_root=mqttRoot,
-                )
-            )
-    if devicetype == "counter":
-        # Create sensors for counter
-        BINARY_SENSORS_PER_COUNTER_CP = copy.deepcopy(BINARY_SENSORS_PER_COUNTER)
-
-        for description in BINARY_SENSORS_PER_COUNTER_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
-            )
-            _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
-
-            sensorList.append(
-                openwbBinarySensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=f"Counter {deviceID}",
-                    mqtt_root=mqttRoot,
-                )
-            )
-
-    if devicetype == "bat":
-        # Create sensors for battery
-        BINARY_SENSORS_PER_BATTERY_CP = copy.deepcopy(BINARY_SENSORS_PER_BATTERY)
-
-        for description in BINARY_SENSORS_PER_BATTERY_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+    if devicetype in _BINARY_SENSORS_PER_DEVICETYPE:
+        descriptions, deviceName = _BINARY_SENSORS_PER_DEVICETYPE[devicetype]
+        for description in descriptions:
+            description = dataclasses.replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
 
@@ -92,28 +64,7 @@ async def async_setup_entry(
                 openwbBinarySensor(
                     uniqueID=f"{integrationUniqueID}",
                     description=description,
-                    device_friendly_name=f"Battery {deviceID}",
-                    mqtt_root=mqttRoot,
-                )
-            )
-
-    if devicetype == "pv":
-        # Create sensors for pv generators
-        BINARY_SENSORS_PER_PVGENERATOR_CP = copy.deepcopy(
-            BINARY_SENSORS_PER_PVGENERATOR
-        )
-
-        for description in BINARY_SENSORS_PER_PVGENERATOR_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
-            )
-            _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
-
-            sensorList.append(
-                openwbBinarySensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=f"PV {deviceID}",
+                    device_friendly_name=f"{deviceName} {deviceID}",
                     mqtt_root=mqttRoot,
                 )
             )
@@ -147,22 +98,24 @@ class openwbBinarySensor(OpenWBBaseEntity, BinarySensorEntity):
     async def async_added_to_hass(self):
         """Subscribe to MQTT events."""
 
-        @callback
-        def message_received(message):
-            """Handle new MQTT messages."""
-            try:
-                self._attr_is_on = bool(int(message.payload))
-            except ValueError:
-                if message.payload == "true":
-                    self._attr_is_on = True
-                elif message.payload == "false":
-                    self._attr_is_on = False
-            # Update entity state with value published on MQTT.
-            self.async_write_ha_state()
-
-        await mqtt.async_subscribe(
-            self.hass,
-            self.entity_description.mqttTopicCurrentValue,
-            message_received,
-            1,
+        self.async_on_remove(
+            await mqtt.async_subscribe(
+                self.hass,
+                self.entity_description.mqttTopicCurrentValue,
+                self._message_received,
+                1,
+            )
         )
+
+    @callback
+    def _message_received(self, message):
+        """Handle new MQTT messages."""
+        try:
+            self._attr_is_on = bool(int(message.payload))
+        except ValueError:
+            if message.payload == "true":
+                self._attr_is_on = True
+            elif message.payload == "false":
+                self._attr_is_on = False
+        # Update entity state with value published on MQTT.
+        self.async_write_ha_state()
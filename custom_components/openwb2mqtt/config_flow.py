@@ -1,10 +1,46 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigFlow
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 # Import global values.
-from .const import DATA_SCHEMA, DEVICEID, DEVICETYPE, DOMAIN, MQTT_ROOT_TOPIC
+from .const import (
+    DEVICEID,
+    DEVICETYPE,
+    DOMAIN,
+    MQTT_ROOT_TOPIC,
+    MQTT_ROOT_TOPIC_DEFAULT,
+)
+
+# Data schema required by configuration flow
+DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(MQTT_ROOT_TOPIC, default=MQTT_ROOT_TOPIC_DEFAULT): cv.string,
+        vol.Required(DEVICETYPE): SelectSelector(
+            SelectSelectorConfig(
+                options=[
+                    SelectOptionDict(value="controller", label="Controller"),
+                    SelectOptionDict(value="counter", label="Counter"),
+                    SelectOptionDict(value="chargepoint", label="Chargepoint"),
+                    SelectOptionDict(value="pv", label="PV Generator"),
+                    SelectOptionDict(value="bat", label="Battery"),
+                ],
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key="config_selector_devicetype",  # translation is maintained in translations/<lang>.json via this translation_key
+            )
+        ),
+        vol.Required(DEVICEID): cv.positive_int,
+    }
+)
 
 
 class openwbmqttConfigFlow(ConfigFlow, domain=DOMAIN):
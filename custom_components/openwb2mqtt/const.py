@@ -1,13 +1,13 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 import datetime
+from functools import lru_cache, partial
 import json
-from zoneinfo import ZoneInfo
-
-import voluptuous as vol
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -31,22 +31,16 @@ from homeassistant.const import (
     UnitOfLength,
     UnitOfPower,
 )
-import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.selector import (
-    SelectOptionDict,
-    SelectSelector,
-    SelectSelectorConfig,
-    SelectSelectorMode,
-)
+from homeassistant.util.json import json_loads
 
-PLATFORMS = [
+PLATFORMS: Final = (
     Platform.SELECT,
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.NUMBER,
     # Platform.SWITCH,
-]
+)
 
 # Global values
 DOMAIN = "openwb2mqtt"
@@ -57,78 +51,95 @@ DEVICEID = "DEVICEID"
 MANUFACTURER = "openWB"
 MODEL = "openWB"
 
-# Data schema required by configuration flow
-DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required(MQTT_ROOT_TOPIC, default=MQTT_ROOT_TOPIC_DEFAULT): cv.string,
-        vol.Required(DEVICETYPE): SelectSelector(
-            SelectSelectorConfig(
-                options=[
-                    SelectOptionDict(value="controller", label="Controller"),
-                    SelectOptionDict(value="counter", label="Counter"),
-                    SelectOptionDict(value="chargepoint", label="Chargepoint"),
-                    SelectOptionDict(value="pv", label="PV Generator"),
-                    SelectOptionDict(value="bat", label="Battery"),
-                ],
-                mode=SelectSelectorMode.DROPDOWN,
-                translation_key="config_selector_devicetype",  # translation is maintained in translations/<lang>.json via this translation_key
-            )
-        ),
-        vol.Required(DEVICEID): cv.positive_int,
-    }
-)
+
+def _jsonLoads(x: str) -> Any:
+    """Decode a JSON payload with orjson, falling back to the json module.
+
+    openWB publishes with Python's json.dumps, which may write NaN or Infinity.
+    orjson rejects these tokens, the json module accepts them.
+    """
+    try:
+        return json_loads(x)
+    except ValueError:
+        return json.loads(x)
+
+
+@lru_cache(maxsize=32)
+def _parseJsonCached(x: str) -> Any:
+    """Parse a JSON payload and cache the result.
+
+    Several entities subscribe to the same topic and extract different values
+    from the same payload, e.g. the L1/L2/L3 sensors or the values of
+    get/connected_vehicle/soc. With the cache, the payload is decoded only
+    once. The returned object is shared, so callers must not modify it.
+    """
+    return _jsonLoads(x)
 
 
-def _splitListToFloat(x: list, desiredValueIndex: int) -> float | None:
+def _splitListToFloat(x: str, desiredValueIndex: int) -> float | None:
     """Extract float value from list at a specified index.
 
     Use this function if the MQTT topic contains a list of values, and you
     want to extract the i-th value from the list.
     For example MQTT = [1.0, 2.0, 3.0] --> extract 3rd value --> sensor value = 3.0
+    The payload is a JSON list, so it is parsed once for all phases.
     """
-    x = x.replace("[", "")
-    x = x.replace("]", "")
     try:
-        y = float(x.split(",")[desiredValueIndex])
-    except (IndexError, ValueError):
-        y = None
-    return y
+        values = _parseJsonCached(x)
+        if isinstance(values, list):
+            return float(values[desiredValueIndex])
+    except (IndexError, TypeError, ValueError):
+        pass
+    return None
 
 
-def _convertDateTime(x: str) -> datetime.datetime | None:
-    """Convert string to datetime object.
+def _absFloat(x: str) -> float | None:
+    """Convert the payload to float and return its absolute value."""
+    try:
+        return abs(float(x))
+    except ValueError:
+        return None
 
-    Assume that the local time zone is the same as the openWB time zone.
-    """
-    a = json.loads(x).get("timestamp")
-    a = int(a)
-    if a is not None:
-        dateTimeObject = datetime.datetime.strptime(a, "%m/%d/%Y, %H:%M:%S")
-        dateTimeObject = dateTimeObject.astimezone(tz=None)
-        return dateTimeObject
-    return a
+
+def _convertWhToKwh(x: str) -> float | None:
+    """Convert an energy value published in Wh to kWh with three decimals."""
+    try:
+        value = float(x)
+    except ValueError:
+        return None
+    return round(value / 1000, 3)
+
+
+def _convertEvseCurrent(x: str) -> float | None:
+    """Convert the EVSE current published in centiampere to ampere."""
+    try:
+        return round(float(x) / 100.0, 2)
+    except ValueError:
+        return None
+
+
+def _truncateFaultStr(x: str) -> str:
+    """Strip quotes and dots from a string payload and limit it to 255 characters."""
+    return x.strip('"').strip(".")[:255]
 
 
 def _umlauteEinfuegen(x: str) -> str:
-    x = x.strip('"').strip(".")[0:255]
-    if "u00fc" in x:
-        x = x.replace("\\u00fc", "ü")
-    if "u00dc" in x:
-        x = x.replace("\\u00dc", "Ü")
-    if "u00f6" in x:
-        x = x.replace("\\u00f6", "ö")
-    if "u00d6" in x:
-        x = x.replace("\\u00d6", "Ö")
-    if "u00e4" in x:
-        x = x.replace("\\u00e4", "ä")
-    if "u00c4" in x:
-        x = x.replace("\\u00c4", "Ä")
+    """Decode the JSON string payload so that escaped umlauts become readable."""
+    if x.startswith('"'):
+        try:
+            x = _jsonLoads(x)
+        except ValueError:
+            pass
+    return _truncateFaultStr(x)
+
 
-    return x
+def _stripQuotes(x: str) -> str:
+    """Remove all double quotes from a string payload."""
+    return x.replace('"', "")
 
 
 def _splitJsonLastLiveValues(x: str, valueToExtract: str, factor: int) -> float:
-    x = json.loads(x).get(valueToExtract)
+    x = _parseJsonCached(x).get(valueToExtract)
     if x is not None:
         try:
             floatValue = float(x)
@@ -140,11 +151,12 @@ def _splitJsonLastLiveValues(x: str, valueToExtract: str, factor: int) -> float:
         return None
 
 
-def _extractTimestampFromJson(x: str, valueToExtract: str) -> datetime.datetime:
-    x = json.loads(x).get(valueToExtract)
+def _extractTimestampFromJson(x: str) -> datetime.datetime:
+    """Extract the unix timestamp from a JSON payload as UTC datetime."""
+    x = _parseJsonCached(x).get("timestamp")
     if x is not None:
         try:
-            ts = datetime.datetime.fromtimestamp(int(x), tz=ZoneInfo("UTC"))
+            ts = datetime.datetime.fromtimestamp(int(x), tz=datetime.UTC)
             return ts
         except ValueError:
             return None
@@ -152,16 +164,16 @@ def _extractTimestampFromJson(x: str, valueToExtract: str) -> datetime.datetime:
         return None
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class openwbSensorEntityDescription(SensorEntityDescription):
     """Enhance the sensor entity description for openWB."""
 
     value_fn: Callable | None = None
-    valueMap: dict | None = None
+    valueMap: Mapping | None = None
     mqttTopicCurrentValue: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class openwbBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Enhance the sensor entity description for openWB."""
 
@@ -169,12 +181,12 @@ class openwbBinarySensorEntityDescription(BinarySensorEntityDescription):
     mqttTopicCurrentValue: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class openwbSelectEntityDescription(SelectEntityDescription):
     """Enhance the select entity description for openWB."""
 
-    valueMapCommand: dict | None = None
-    valueMapCurrentValue: dict | None = None
+    valueMapCommand: Mapping | None = None
+    valueMapCurrentValue: Mapping | None = None
     mqttTopicCommand: str | None = None
     mqttTopicCurrentValue: str | None = None
     mqttTopicOptions: list | None = None
@@ -182,7 +194,7 @@ class openwbSelectEntityDescription(SelectEntityDescription):
     modes: list | None = None
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class openwbSwitchEntityDescription(SwitchEntityDescription):
     """Enhance the select entity description for openWB."""
 
@@ -191,7 +203,7 @@ class openwbSwitchEntityDescription(SwitchEntityDescription):
     mqttTopicChargeMode: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class openWBNumberEntityDescription(NumberEntityDescription):
     """Enhance the number entity description for openWB."""
 
@@ -201,33 +213,58 @@ class openWBNumberEntityDescription(NumberEntityDescription):
     value_fn: Callable | None = None
 
 
-SENSORS_PER_CHARGEPOINT = [
-    openwbSensorEntityDescription(
-        key="get/currents",
-        name="Strom (L1)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="get/currents",
-        name="Strom (L2)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
+def _phaseSensors(
+    key: str, name: str, **kwargs: Any
+) -> tuple[openwbSensorEntityDescription, ...]:
+    """Create the sensors for phases L1 to L3 of a topic publishing a list."""
+    return tuple(
+        openwbSensorEntityDescription(
+            key=key,
+            name=f"{name} (L{index + 1})",
+            value_fn=partial(_splitListToFloat, desiredValueIndex=index),
+            **kwargs,
+        )
+        for index in range(3)
+    )
+
+
+_CHARGEMODE_LABELS: Final = MappingProxyType(
+    {
+        "standby": "Standby",
+        "stop": "Stop",
+        "scheduled_charging": "Scheduled Charging",
+        "time_charging": "Time Charging",
+        "instant_charging": "Instant Charging",
+        "pv_charging": "PV Charging",
+    }
+)
+# Time charging cannot be selected from Home Assistant
+_CHARGEMODE_SELECT_LABELS: Final = MappingProxyType(
+    {
+        mode: label
+        for mode, label in _CHARGEMODE_LABELS.items()
+        if mode != "time_charging"
+    }
+)
+_CHARGEMODE_SELECT_COMMANDS: Final = MappingProxyType(
+    {label: mode for mode, label in _CHARGEMODE_SELECT_LABELS.items()}
+)
+_VEHICLE_LABELS: Final = MappingProxyType(
+    {vehicle_id: f"Vehicle {vehicle_id}" for vehicle_id in range(11)}
+)
+_VEHICLE_COMMANDS: Final = MappingProxyType(
+    {label: str(vehicle_id) for vehicle_id, label in _VEHICLE_LABELS.items()}
+)
+
+
+SENSORS_PER_CHARGEPOINT: Final = (
+    *_phaseSensors(
         key="get/currents",
-        name="Strom (L3)",
+        name="Strom",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
     ),
     openwbSensorEntityDescription(
         key="get/daily_imported",
@@ -235,7 +272,7 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
@@ -244,7 +281,7 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         icon="mdi:counter",
         entity_registry_enabled_default=False,
     ),
@@ -253,7 +290,7 @@ SENSORS_PER_CHARGEPOINT = [
         name="Ladestromvorgabe",
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda x: round(float(x) / 100.0, 2),
+        value_fn=_convertEvseCurrent,
         suggested_display_precision=1,
         entity_registry_enabled_default=False,
         icon="mdi:current-ac",
@@ -264,7 +301,7 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:counter",
         entity_registry_enabled_default=False,
@@ -275,7 +312,7 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=None,
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        value_fn=_truncateFaultStr,
     ),
     openwbSensorEntityDescription(
         key="get/imported",
@@ -283,7 +320,7 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
@@ -307,91 +344,31 @@ SENSORS_PER_CHARGEPOINT = [
         device_class=None,
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: _umlauteEinfuegen(x),
-    ),
-    openwbSensorEntityDescription(
-        key="get/voltages",
-        name="Spannung (L1)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 0),
+        value_fn=_umlauteEinfuegen,
     ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="get/voltages",
-        name="Spannung (L2)",
+        name="Spannung",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 1),
     ),
-    openwbSensorEntityDescription(
-        key="get/voltages",
-        name="Spannung (L3)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 2),
-    ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="get/power_factors",
-        name="Leistungsfaktor (L1)",
+        name="Leistungsfaktor",
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 0),
         entity_registry_enabled_default=False,
     ),
-    openwbSensorEntityDescription(
-        key="get/power_factors",
-        name="Leistungsfaktor (L2)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 1),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="get/power_factors",
-        name="Leistungsfaktor (L3)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 2),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="get/powers",
-        name="Leistung (L1)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="get/powers",
-        name="Leistung (L2)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="get/powers",
-        name="Leistung (L3)",
+        name="Leistung",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 2),
     ),
     openwbSensorEntityDescription(
         key="get/frequency",
@@ -408,7 +385,7 @@ SENSORS_PER_CHARGEPOINT = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("name").replace('"', ""),
+        value_fn=lambda x: _parseJsonCached(x).get("name").replace('"', ""),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/info",
@@ -417,7 +394,7 @@ SENSORS_PER_CHARGEPOINT = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("id"),
+        value_fn=lambda x: _parseJsonCached(x).get("id"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/info",
@@ -426,7 +403,7 @@ SENSORS_PER_CHARGEPOINT = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("name").replace('"', ""),
+        value_fn=lambda x: _parseJsonCached(x).get("name").replace('"', ""),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/config",
@@ -435,22 +412,15 @@ SENSORS_PER_CHARGEPOINT = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("charge_template"),
+        value_fn=lambda x: _parseJsonCached(x).get("charge_template"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/config",
         name="Lademodus",
         device_class=None,
         native_unit_of_measurement=None,
-        value_fn=lambda x: json.loads(x).get("chargemode"),
-        valueMap={
-            "standby": "Standby",
-            "stop": "Stop",
-            "scheduled_charging": "Scheduled Charging",
-            "time_charging": "Time Charging",
-            "instant_charging": "Instant Charging",
-            "pv_charging": "PV Charging",
-        },
+        value_fn=lambda x: _parseJsonCached(x).get("chargemode"),
+        valueMap=_CHARGEMODE_LABELS,
         translation_key="sensor_lademodus",
     ),
     openwbSensorEntityDescription(
@@ -461,7 +431,7 @@ SENSORS_PER_CHARGEPOINT = [
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=True,
         suggested_display_precision=0,
-        value_fn=lambda x: json.loads(x).get("soc"),
+        value_fn=lambda x: _parseJsonCached(x).get("soc"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/soc",
@@ -471,7 +441,7 @@ SENSORS_PER_CHARGEPOINT = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:clock-time-eight",
-        value_fn=lambda x: _extractTimestampFromJson(x, "timestamp"),
+        value_fn=_extractTimestampFromJson,
         # Example: "01/02/2024, 15:29:12"
     ),
     openwbSensorEntityDescription(
@@ -500,12 +470,19 @@ SENSORS_PER_CHARGEPOINT = [
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:map-marker-distance",
         entity_registry_enabled_default=False,
-        value_fn=lambda x: json.loads(x).get("range_charged"),
+        value_fn=lambda x: _parseJsonCached(x).get("range_charged"),
         suggested_display_precision=1,
     ),
-]
+)
+
+_BINARY_SENSOR_FAULT_STATE = openwbBinarySensorEntityDescription(
+    key="fault_state",
+    name="Fehler",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-BINARY_SENSORS_PER_CHARGEPOINT = [
+BINARY_SENSORS_PER_CHARGEPOINT: Final = (
     openwbBinarySensorEntityDescription(
         key="plug_state",
         name="Ladekabel",
@@ -516,36 +493,17 @@ BINARY_SENSORS_PER_CHARGEPOINT = [
         name="Autoladestatus",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
     ),
-    openwbBinarySensorEntityDescription(
-        key="fault_state",
-        name="Fehler",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-]
+    _BINARY_SENSOR_FAULT_STATE,
+)
 
-SELECTS_PER_CHARGEPOINT = [
+SELECTS_PER_CHARGEPOINT: Final = (
     openwbSelectEntityDescription(
         key="chargemode",
         entity_category=EntityCategory.CONFIG,
         name="Lademodus",
         translation_key="selector_chargepoint_chargemode",  # translation is maintained in translations/<lang>.json via this translation_key
-        valueMapCurrentValue={
-            "instant_charging": "Instant Charging",
-            "scheduled_charging": "Scheduled Charging",
-            "pv_charging": "PV Charging",
-            "standby": "Standby",
-            "stop": "Stop",
-            # "time_charging": "Time Charging",
-        },
-        valueMapCommand={
-            "Instant Charging": "instant_charging",
-            "Scheduled Charging": "scheduled_charging",
-            "PV Charging": "pv_charging",
-            "Standby": "standby",
-            "Stop": "stop",
-            # "Time Charging": "time_charging",
-        },
+        valueMapCurrentValue=_CHARGEMODE_SELECT_LABELS,
+        valueMapCommand=_CHARGEMODE_SELECT_COMMANDS,
         mqttTopicCommand="set/vehicle/template/charge_template/_chargeTemplateID_/chargemode/selected",
         mqttTopicCurrentValue="get/connected_vehicle/config",
         options=[
@@ -555,72 +513,26 @@ SELECTS_PER_CHARGEPOINT = [
             "Stop",
             "Standby",
         ],
-        value_fn=lambda x: json.loads(x).get("chargemode"),
+        value_fn=lambda x: _parseJsonCached(x).get("chargemode"),
     ),
     openwbSelectEntityDescription(
         key="connected_vehicle",
         entity_category=EntityCategory.CONFIG,
         name="Angeschlossenes Fahrzeug",
         translation_key="selector_connected_vehicle",
-        valueMapCurrentValue={
-            0: "Vehicle 0",
-            1: "Vehicle 1",
-            2: "Vehicle 2",
-            3: "Vehicle 3",
-            4: "Vehicle 4",
-            5: "Vehicle 5",
-            6: "Vehicle 6",
-            7: "Vehicle 7",
-            8: "Vehicle 8",
-            9: "Vehicle 9",
-            10: "Vehicle 10",
-        },
-        valueMapCommand={
-            "Vehicle 0": "0",
-            "Vehicle 1": "1",
-            "Vehicle 2": "2",
-            "Vehicle 3": "3",
-            "Vehicle 4": "4",
-            "Vehicle 5": "5",
-            "Vehicle 6": "6",
-            "Vehicle 7": "7",
-            "Vehicle 8": "8",
-            "Vehicle 9": "9",
-            "Vehicle 10": "10",
-        },
-        options=[
-            "Vehicle 0",
-            "Vehicle 1",
-            "Vehicle 2",
-            "Vehicle 3",
-            "Vehicle 4",
-            "Vehicle 5",
-            "Vehicle 6",
-            "Vehicle 7",
-            "Vehicle 8",
-            "Vehicle 9",
-            "Vehicle 10",
-        ],
+        valueMapCurrentValue=_VEHICLE_LABELS,
+        valueMapCommand=_VEHICLE_COMMANDS,
+        options=list(_VEHICLE_LABELS.values()),
         mqttTopicCommand="set/chargepoint/_chargePointID_/config/ev",
         mqttTopicCurrentValue="get/connected_vehicle/info",
-        mqttTopicOptions=("vehicle/0/name",
-                            "vehicle/1/name",
-                            "vehicle/2/name",
-                            "vehicle/3/name",
-                            "vehicle/4/name",
-                            "vehicle/5/name",
-                            "vehicle/6/name",
-                            "vehicle/7/name",
-                            "vehicle/8/name",
-                            "vehicle/9/name",
-                            "vehicle/10/name",
-        ),
-        value_fn=lambda x: json.loads(x).get("id"),
+        # Names of all vehicles, openWB supports the vehicle IDs 0 to 10
+        mqttTopicOptions=("vehicle/+/name",),
+        value_fn=lambda x: _parseJsonCached(x).get("id"),
         entity_registry_enabled_default=False,
     ),
-]
+)
 
-NUMBERS_PER_CHARGEPOINT = [
+NUMBERS_PER_CHARGEPOINT: Final = (
     openWBNumberEntityDescription(
         key="manual_soc",
         name="Aktueller SoC (Manuelles SoC Modul)",
@@ -635,113 +547,34 @@ NUMBERS_PER_CHARGEPOINT = [
         mqttTopicCurrentValue="get/connected_vehicle/soc",
         mqttTopicChargeMode=None,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: json.loads(x).get("soc"),
+        value_fn=lambda x: _parseJsonCached(x).get("soc"),
     ),
-    # openWBNumberEntityDescription(
-    #     key="pv_charging_min_current",
-    #     name="Ladestromvorgabe (PV Laden)",
-    #     native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-    #     device_class=SensorDeviceClass.POWER,
-    #     icon="mdi:current-ac",
-    #     native_min_value=0,
-    #     native_max_value=16,
-    #     native_step=1,
-    #     entity_category=EntityCategory.CONFIG,
-    #     mqttTopicCommand="set/vehicle/template/charge_template/_chargeTemplateID_/chargemode/pv_charging/min_current",
-    #     mqttTopicCurrentValue="vehicle/template/charge_template/_ChargeTemplateID_",
-    #     mqttTopicChargeMode=None,
-    #     # entity_registry_enabled_default=False,
-    #     value_fn=lambda x: json.loads(x)
-    #     .get("chargemode")
-    #     .get("pv_charging")
-    #     .get("min_current"),
-    # ),
-]
+)
 
-SENSORS_PER_COUNTER = [
-    openwbSensorEntityDescription(
+SENSORS_PER_COUNTER: Final = (
+    *_phaseSensors(
         key="voltages",
-        name="Spannung (L1)",
+        name="Spannung",
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="voltages",
-        name="Spannung (L2)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="voltages",
-        name="Spannung (L3)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 2),
-    ),
-    openwbSensorEntityDescription(
-        key="power_factors",
-        name="Leistungsfaktor (L1)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 0),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="power_factors",
-        name="Leistungsfaktor (L2)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 1),
-        entity_registry_enabled_default=False,
     ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="power_factors",
-        name="Leistungsfaktor (L3)",
+        name="Leistungsfaktor",
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 2),
         entity_registry_enabled_default=False,
     ),
-    openwbSensorEntityDescription(
-        key="powers",
-        name="Leistung (L1)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="powers",
-        name="Leistung (L2)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="powers",
-        name="Leistung (L3)",
+        name="Leistung",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 2),
     ),
     openwbSensorEntityDescription(
         key="frequency",
@@ -751,32 +584,13 @@ SENSORS_PER_COUNTER = [
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         # icon="mdi:current-ac",
     ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L1)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="currents",
-        name="Strom (L2)",
+        name="Strom",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L3)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
     ),
     openwbSensorEntityDescription(
         key="power",
@@ -793,7 +607,7 @@ SENSORS_PER_COUNTER = [
         device_class=None,
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        value_fn=_truncateFaultStr,
     ),
     openwbSensorEntityDescription(
         key="exported",
@@ -801,7 +615,7 @@ SENSORS_PER_COUNTER = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:transmission-tower-export",
     ),
@@ -811,7 +625,7 @@ SENSORS_PER_COUNTER = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:transmission-tower-import",
     ),
@@ -821,7 +635,7 @@ SENSORS_PER_COUNTER = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=1,
         icon="mdi:transmission-tower-import",
     ),
@@ -831,22 +645,15 @@ SENSORS_PER_COUNTER = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=1,
         icon="mdi:transmission-tower-export",
     ),
-]
+)
 
-BINARY_SENSORS_PER_COUNTER = [
-    openwbBinarySensorEntityDescription(
-        key="fault_state",
-        name="Fehler",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-]
+BINARY_SENSORS_PER_COUNTER: Final = (_BINARY_SENSOR_FAULT_STATE,)
 
-SENSORS_PER_BATTERY = [
+SENSORS_PER_BATTERY: Final = (
     openwbSensorEntityDescription(
         key="soc",
         name="Ladung",
@@ -871,7 +678,7 @@ SENSORS_PER_BATTERY = [
         device_class=None,
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        value_fn=_truncateFaultStr,
     ),
     openwbSensorEntityDescription(
         key="exported",
@@ -879,7 +686,7 @@ SENSORS_PER_BATTERY = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:battery-arrow-up",
     ),
@@ -889,7 +696,7 @@ SENSORS_PER_BATTERY = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:battery-arrow-down",
     ),
@@ -899,7 +706,7 @@ SENSORS_PER_BATTERY = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=1,
         icon="mdi:battery-arrow-down",
     ),
@@ -909,29 +716,22 @@ SENSORS_PER_BATTERY = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=1,
         icon="mdi:battery-arrow-up",
     ),
-]
+)
 
-BINARY_SENSORS_PER_BATTERY = [
-    openwbBinarySensorEntityDescription(
-        key="fault_state",
-        name="Fehler",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-]
+BINARY_SENSORS_PER_BATTERY: Final = (_BINARY_SENSOR_FAULT_STATE,)
 
-SENSORS_PER_PVGENERATOR = [
+SENSORS_PER_PVGENERATOR: Final = (
     openwbSensorEntityDescription(
         key="daily_exported",
         name="Zählerstand (Heute)",
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=1,
         icon="mdi:counter",
     ),
@@ -941,7 +741,7 @@ SENSORS_PER_PVGENERATOR = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
@@ -951,7 +751,7 @@ SENSORS_PER_PVGENERATOR = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
@@ -961,7 +761,7 @@ SENSORS_PER_PVGENERATOR = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        value_fn=_convertWhToKwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
@@ -974,34 +774,15 @@ SENSORS_PER_PVGENERATOR = [
         entity_registry_enabled_default=True,
         icon="mdi:solar-power",
         suggested_display_precision=0,
-        value_fn=lambda x: abs(float(x)),
+        value_fn=_absFloat,
     ),
-    openwbSensorEntityDescription(
+    *_phaseSensors(
         key="currents",
-        name="Strom (L1)",
+        name="Strom",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L2)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L3)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
     ),
     openwbSensorEntityDescription(
         key="fault_str",
@@ -1009,20 +790,13 @@ SENSORS_PER_PVGENERATOR = [
         device_class=None,
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        value_fn=_truncateFaultStr,
     ),
-]
+)
 
-BINARY_SENSORS_PER_PVGENERATOR = [
-    openwbBinarySensorEntityDescription(
-        key="fault_state",
-        name="Fehler",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-]
+BINARY_SENSORS_PER_PVGENERATOR: Final = (_BINARY_SENSOR_FAULT_STATE,)
 
-SENSORS_CONTROLLER = [
+_SENSORS_CONTROLLER_SYSTEM = (
     # System
     openwbSensorEntityDescription(
         key="system/ip_address",
@@ -1031,7 +805,7 @@ SENSORS_CONTROLLER = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:earth",
-        value_fn=lambda x: x.replace('"', ""),
+        value_fn=_stripQuotes,
     ),
     openwbSensorEntityDescription(
         key="system/version",
@@ -1040,7 +814,7 @@ SENSORS_CONTROLLER = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:folder-clock",
-        value_fn=lambda x: x.replace('"', ""),
+        value_fn=_stripQuotes,
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
@@ -1049,10 +823,7 @@ SENSORS_CONTROLLER = [
         native_unit_of_measurement=None,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:clock-time-eight",
-        # value_fn=lambda x: datetime.datetime.fromtimestamp(
-        #    int(json.loads(x).get("timestamp")), tz=ZoneInfo("UTC")
-        # ),
-        value_fn=lambda x: _extractTimestampFromJson(x, "timestamp"),
+        value_fn=_extractTimestampFromJson,
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
@@ -1113,18 +884,23 @@ SENSORS_CONTROLLER = [
         suggested_display_precision=0,
         value_fn=lambda x: _splitJsonLastLiveValues(x, "bat-all-soc", 1),
     ),
-]
+)
 
 # get vehicle names
-for vehicle_id in range(11):
-    SENSORS_CONTROLLER.append(
-        openwbSensorEntityDescription(
-            key=f"vehicle/{vehicle_id}/name",
-            name=f"Vehicle Name {vehicle_id}",
-            device_class=None,
-            native_unit_of_measurement=None,
-            entity_category=EntityCategory.DIAGNOSTIC,
-            icon="mdi:car-electric-outline",
-            value_fn=lambda x: x.replace('"', ""),
-        ),
+_SENSORS_CONTROLLER_VEHICLE_NAMES = tuple(
+    openwbSensorEntityDescription(
+        key=f"vehicle/{vehicle_id}/name",
+        name=f"Vehicle Name {vehicle_id}",
+        device_class=None,
+        native_unit_of_measurement=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:car-electric-outline",
+        value_fn=_stripQuotes,
     )
+    for vehicle_id in range(11)
+)
+
+SENSORS_CONTROLLER: Final = (
+    *_SENSORS_CONTROLLER_SYSTEM,
+    *_SENSORS_CONTROLLER_VEHICLE_NAMES,
+)
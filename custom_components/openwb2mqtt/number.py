@@ -1,7 +1,7 @@
 """OpenWB Number Entity."""
 from __future__ import annotations
 
-import copy
+import dataclasses
 import logging
 
 from homeassistant.components import mqtt
@@ -27,6 +27,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities are updated via MQTT push, so no update semaphore is needed.
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -40,10 +43,12 @@ async def async_setup_entry(
 
     if devicetype == "chargepoint":
         # Create numbers for chargepoint
-        NUMBERS_PER_CHARGEPOINT_CP = copy.deepcopy(NUMBERS_PER_CHARGEPOINT)
-        for description in NUMBERS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCommand = f"{mqttRoot}/{description.mqttTopicCommand}"
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}"
+        for description in NUMBERS_PER_CHARGEPOINT:
+            description = dataclasses.replace(
+                description,
+                mqttTopicCommand=f"{mqttRoot}/{description.mqttTopicCommand}",
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}",
+            )
 
             numberList.append(
                 openWBNumber(
@@ -98,6 +103,12 @@ class openWBNumber(OpenWBBaseEntity, NumberEntity):
 
         self.deviceID = deviceID
         self.mqtt_root = mqtt_root
+        # The command topic of e.g. the manual SoC contains the vehicle ID
+        self._topicNeedsVehicle = "_vehicleID_" in description.mqttTopicCommand
+        # sensor.openwb_openwb_chargepoint_4_fahrzeug_id
+        self._vehicleUniqueID = slugify(
+            f"{mqtt_root}_chargepoint_{deviceID}_fahrzeug_id"
+        )
 
         if native_min_value is not None:
             self._attr_native_min_value = native_min_value
@@ -109,32 +120,35 @@ class openWBNumber(OpenWBBaseEntity, NumberEntity):
     async def async_added_to_hass(self):
         """Subscribe to MQTT events."""
 
-        @callback
-        def message_received(message):
-            """Handle new MQTT messages.
-
-            If defined, convert values.
-            """
-            if self.entity_description.value_fn is not None:
-                self._attr_native_value = self.entity_description.value_fn(
-                    message.payload
-                )
-            else:
-                self._attr_native_value = message.payload
-            self.async_write_ha_state()
-
         # Subscribe to MQTT topic and connect callack message
         _LOGGER.debug(
             "Subscribed to MQTT topic: %s",
             self.entity_description.mqttTopicCurrentValue,
         )
-        await mqtt.async_subscribe(
-            self.hass,
-            self.entity_description.mqttTopicCurrentValue,
-            message_received,
-            1,
+        self.async_on_remove(
+            await mqtt.async_subscribe(
+                self.hass,
+                self.entity_description.mqttTopicCurrentValue,
+                self._message_received,
+                1,
+            )
         )
 
+    @callback
+    def _message_received(self, message):
+        """Handle new MQTT messages.
+
+        If defined, convert values. The state is only written if the value changed.
+        """
+        if self.entity_description.value_fn is not None:
+            value = self.entity_description.value_fn(message.payload)
+        else:
+            value = message.payload
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
     async def async_set_native_value(self, value):
         """Update the current value.
 
@@ -142,18 +156,12 @@ class openWBNumber(OpenWBBaseEntity, NumberEntity):
         But the HA sensor shall only change when the MQTT message on the /get/ topic is received.
         Only then, openWB has changed the setting as well.
         """
-        if slugify("Ladestromvorgabe (PV Laden)") in self.entity_id:
-            success = self.publishToMQTT(int(value))
-            if success:
-                self._attr_native_value = value
-                self.async_write_ha_state()
-        else:
-            success = self.publishToMQTT(value)
+        success = await self.publishToMQTT(value)
         if success:
             return
         _LOGGER.error("Error publishing MQTT message")
 
-    def publishToMQTT(self, valueToPublish: float) -> bool:
+    async def publishToMQTT(self, valueToPublish: float) -> bool:
         """Publish message to MQTT.
 
         If necessary, placeholders in MQTT topic are replaced.
@@ -162,13 +170,12 @@ class openWBNumber(OpenWBBaseEntity, NumberEntity):
         topic = self.entity_description.mqttTopicCommand
 
         # Modify topic: Manual SoC
-        if slugify("Aktueller SoC (Manuelles SoC Modul)") in self.entity_id:
+        if self._topicNeedsVehicle:
             vehicle_id = self.get_assigned_vehicle(self.hass, INTEGRATION_DOMAIN)
             if vehicle_id is not None:
                 # Replace placeholders
-                if "_vehicleID_" in topic:
-                    topic = topic.replace("_vehicleID_", vehicle_id)
-                    publish_mqtt_message = True
+                topic = topic.replace("_vehicleID_", vehicle_id)
+                publish_mqtt_message = True
         # # Modify topic: pv_charging_min_current
         # elif slugify("Ladestromvorgabe (PV Laden)") in self.entity_id:
         #     charge_template = self.get_assigned_charge_profile(
@@ -189,18 +196,17 @@ class openWBNumber(OpenWBBaseEntity, NumberEntity):
         _LOGGER.debug("MQTT payload: %s", payload)
 
         if publish_mqtt_message:
-            self.hass.components.mqtt.publish(self.hass, topic, payload)
+            await mqtt.async_publish(self.hass, topic, payload)
 
         return publish_mqtt_message
 
     def get_assigned_vehicle(self, hass: HomeAssistant, domain: str) -> int | None:
         """Get the vehicle that is currently assigned to this charge point."""
         ent_reg = er.async_get(hass)
-        unique_id = slugify(f"{self.mqtt_root}_chargepoint_{self.deviceID}_fahrzeug_id")
         vehicle_id = ent_reg.async_get_entity_id(
             Platform.SENSOR,
             domain,
-            unique_id,
+            self._vehicleUniqueID,
         )
         if vehicle_id is None:
             return None
@@ -1,7 +1,7 @@
 """OpenWB Selector."""
 from __future__ import annotations
 
-import copy
+import dataclasses
 import logging
 
 from homeassistant.components import mqtt
@@ -25,6 +25,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities are updated via MQTT push, so no update semaphore is needed.
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,18 +43,22 @@ async def async_setup_entry(
     selectList = []
 
     if devicetype == "chargepoint":
-        SELECTS_PER_CHARGEPOINT_CP = copy.deepcopy(SELECTS_PER_CHARGEPOINT)
-        for description in SELECTS_PER_CHARGEPOINT_CP:
-            if "_chargePointID_" in description.mqttTopicCommand:
-                description.mqttTopicCommand = description.mqttTopicCommand.replace(
-                    "_chargePointID_", str(deviceID)
+        for description in SELECTS_PER_CHARGEPOINT:
+            mqttTopicCommand = description.mqttTopicCommand.replace(
+                "_chargePointID_", str(deviceID)
+            )
+            mqttTopicOptions = description.mqttTopicOptions
+            if mqttTopicOptions is not None:
+                mqttTopicOptions = tuple(
+                    f"{mqttRoot}/{option}" for option in mqttTopicOptions
                 )
-            description.mqttTopicCommand = f"{mqttRoot}/{description.mqttTopicCommand}"
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}"
-            
-            if description.mqttTopicOptions is not None:
-                description.mqttTopicOptions = [f"{mqttRoot}/{option}" for option in description.mqttTopicOptions]
-            
+            description = dataclasses.replace(
+                description,
+                mqttTopicCommand=f"{mqttRoot}/{mqttTopicCommand}",
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}",
+                mqttTopicOptions=mqttTopicOptions,
+            )
+
             selectList.append(
                 openwbSelect(
                     unique_id=f"{integrationUniqueID}",
@@ -91,98 +98,117 @@ class openwbSelect(OpenWBBaseEntity, SelectEntity):
         self._attr_current_option = None
         self.deviceID = deviceID
         self.mqtt_root = mqtt_root
+        # sensor.openwb_openwb_chargepoint_4_lade_profil
+        self._chargeProfileUniqueID = slugify(
+            f"{mqtt_root}_chargepoint_{deviceID}_lade_profil"
+        )
 
-    @property
-    def options(self) -> list[str]:
-        """Return a set of selectable options."""
-        try:
-            return self.entity_description.options
-        except Exception as ex:
-            pass
-        return []
+        # Options and value maps can be renamed at runtime (see option_received),
+        # so each entity works on its own copy instead of the shared description.
+        self._attr_options = list(description.options or [])
+        self._valueMapCurrentValue = (
+            dict(description.valueMapCurrentValue)
+            if description.valueMapCurrentValue is not None
+            else None
+        )
+        self._valueMapCommand = (
+            dict(description.valueMapCommand)
+            if description.valueMapCommand is not None
+            else None
+        )
 
     async def async_added_to_hass(self):
         """Subscribe to MQTT events."""
 
-        @callback
-        def message_received(message):
-            """Handle new MQTT messages.
-
-            If defined, convert and map values.
-            """
-            payload = message.payload
-            # Convert data if a conversion function is defined
-            if self.entity_description.value_fn is not None:
-                payload = self.entity_description.value_fn(payload)
-            # Map values as defined in the value map dict.
-            # First try to map integer values, then string values.
-            # If no value can be mapped, use original value without conversion.
-            if self.entity_description.valueMapCurrentValue is not None:
-                try:
-                    self._attr_current_option = (
-                        self.entity_description.valueMapCurrentValue.get(int(payload))
-                    )
-                except ValueError:
-                    self._attr_current_option = (
-                        self.entity_description.valueMapCurrentValue.get(payload, None)
-                    )
-            else:
-                self._attr_current_option = payload
-
-            self.async_write_ha_state()
-
-        @callback
-        def option_received(message):
-            """Handle new MQTT messages.
-
-            If defined, convert and map values.
-            """
-            topic = message.topic
-            payload = message.payload.replace('"',"")
-            vehicle_id = int(topic.split("/")[-2])
-
-            self.entity_description.options[vehicle_id] = payload
-            
-            if self.entity_description.valueMapCurrentValue is not None:
-                self.entity_description.valueMapCurrentValue[vehicle_id] = payload
-            
-            # delete old vehicle name in valueMapCommand
-            if self.entity_description.valueMapCommand is not None:
-                for key, value in dict(self.entity_description.valueMapCommand).items():
-                    if value == vehicle_id:
-                        del self.entity_description.valueMapCommand[key]
-
-                self.entity_description.valueMapCommand[f"{payload}"] = f"{vehicle_id}"
-
         # Subscribe to MQTT topic and connect callback message
         if self.entity_description.mqttTopicCurrentValue is not None:
-            await mqtt.async_subscribe(
-                self.hass,
-                self.entity_description.mqttTopicCurrentValue,
-                message_received,
-                1,
+            self.async_on_remove(
+                await mqtt.async_subscribe(
+                    self.hass,
+                    self.entity_description.mqttTopicCurrentValue,
+                    self._message_received,
+                    1,
+                )
             )
 
         # Subscribe to MQTT topic options and connect callback message
         if self.entity_description.mqttTopicOptions is not None:
             for option in self.entity_description.mqttTopicOptions:
-                await mqtt.async_subscribe(
-                    self.hass,
-                    option,
-                    option_received,
-                    1,
+                self.async_on_remove(
+                    await mqtt.async_subscribe(
+                        self.hass,
+                        option,
+                        self._option_received,
+                        1,
+                    )
+                )
+
+    @callback
+    def _message_received(self, message):
+        """Handle new MQTT messages.
+
+        If defined, convert and map values.
+        """
+        payload = message.payload
+        # Convert data if a conversion function is defined
+        if self.entity_description.value_fn is not None:
+            payload = self.entity_description.value_fn(payload)
+        # Map values as defined in the value map dict.
+        # First try to map integer values, then string values.
+        # If no value can be mapped, use original value without conversion.
+        if self._valueMapCurrentValue is not None:
+            try:
+                self._attr_current_option = self._valueMapCurrentValue.get(
+                    int(payload)
                 )
+            except ValueError:
+                self._attr_current_option = self._valueMapCurrentValue.get(
+                    payload, None
+                )
+        else:
+            self._attr_current_option = payload
+
+        self.async_write_ha_state()
+
+    @callback
+    def _option_received(self, message):
+        """Handle new MQTT messages.
+
+        If defined, convert and map values.
+        """
+        try:
+            vehicle_id = int(message.topic.split("/")[-2])
+        except ValueError:
+            return
+        # Ignore vehicles without a slot in the options list
+        if not 0 <= vehicle_id < len(self._attr_options):
+            return
+        payload = message.payload.replace('"',"")
+        vehicle = str(vehicle_id)
+
+        oldName = self._attr_options[vehicle_id]
+        self._attr_options[vehicle_id] = payload
+
+        if self._valueMapCurrentValue is not None:
+            self._valueMapCurrentValue[vehicle_id] = payload
+
+        # delete old vehicle name in valueMapCommand
+        if self._valueMapCommand is not None:
+            if self._valueMapCommand.get(oldName) == vehicle:
+                del self._valueMapCommand[oldName]
+
+            self._valueMapCommand[payload] = vehicle
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        success = self.publishToMQTT(option)
+        success = await self.publishToMQTT(option)
         if success:
             # self._attr_current_option = option
             # self.async_write_ha_state()
             return
         _LOGGER.error("Error publishing MQTT message")
 
-    def publishToMQTT(self, commandValueToPublish) -> bool:
+    async def publishToMQTT(self, commandValueToPublish) -> bool:
         """Publish message to MQTT.
 
         If defined, you can remap the value in HA to the value that is required by the integration.
@@ -204,11 +230,9 @@ class openwbSelect(OpenWBBaseEntity, SelectEntity):
         _LOGGER.debug("MQTT topic: %s", topic)
 
         # Modify commandValueToPublish if mapping table is defined
-        if self.entity_description.valueMapCommand is not None:
+        if self._valueMapCommand is not None:
             try:
-                payload = self.entity_description.valueMapCommand.get(
-                    commandValueToPublish
-                )
+                payload = self._valueMapCommand.get(commandValueToPublish)
                 _LOGGER.debug("MQTT payload: %s", payload)
                 publish_mqtt_message = True
             except ValueError:
@@ -218,7 +242,7 @@ class openwbSelect(OpenWBBaseEntity, SelectEntity):
             publish_mqtt_message = True
 
         if publish_mqtt_message:
-            self.hass.components.mqtt.publish(self.hass, topic, payload)
+            await mqtt.async_publish(self.hass, topic, payload)
 
         return publish_mqtt_message
 
@@ -228,12 +252,10 @@ class openwbSelect(OpenWBBaseEntity, SelectEntity):
     ) -> str | None:
         """Get the charge profile that is currently assigned to this charge point."""
         ent_reg = er.async_get(hass)
-        # sensor.openwb_openwb_chargepoint_4_lade_profil
-        unique_id = slugify(f"{self.mqtt_root}_chargepoint_{self.deviceID}_lade_profil")
         charge_profile_id = ent_reg.async_get_entity_id(
             Platform.SENSOR,
             domain,
-            unique_id,
+            self._chargeProfileUniqueID,
         )
         if charge_profile_id is None:
             return None
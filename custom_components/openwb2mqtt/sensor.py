@@ -1,9 +1,9 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
-import copy
-import json
+import dataclasses
 import logging
+from typing import Final
 
 from homeassistant.components import mqtt
 from homeassistant.components.sensor import SensorEntity
@@ -29,6 +29,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities are updated via MQTT push, so no update semaphore is needed.
+PARALLEL_UPDATES = 0
+
+# Sensor descriptions, device name and topic infix per device type.
+# The chargepoint keys already contain their subtopic (get/ or config/).
+_SENSORS_PER_DEVICETYPE: Final = {
+    "chargepoint": (SENSORS_PER_CHARGEPOINT, "Chargepoint", ""),
+    "counter": (SENSORS_PER_COUNTER, "Counter", "get/"),
+    "bat": (SENSORS_PER_BATTERY, "Battery", "get/"),
+    "pv": (SENSORS_PER_PVGENERATOR, "PV", "get/"),
+}
+
+# Icons of the phases_in_use sensor per number of active phases
+_PHASES_IN_USE_ICONS: Final = {
+    0: "mdi:numeric-0-circle-outline",
+    1: "mdi:numeric-1-circle-outline",
+    3: "mdi:numeric-3-circle-outline",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -42,77 +61,32 @@ async def async_setup_entry(
     sensorList = []
 
     if devicetype == "controller":
-        SENSORS_CONTROLLER_CP = copy.deepcopy(SENSORS_CONTROLLER)
-        for description in SENSORS_CONTROLLER_CP:
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{description.key}"
-            sensorList.append(
-                openwbSensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=MANUFACTURER,
-                    mqtt_root=mqttRoot,
-                )
-            )
-
-    if devicetype == "chargepoint":
-        # Create sensors for chargepoint
-        SENSORS_PER_CHARGEPOINT_CP = copy.deepcopy(SENSORS_PER_CHARGEPOINT)
-        for description in SENSORS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/{description.key}"
-            )
-            sensorList.append(
-                openwbSensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=f"Chargepoint {deviceID}",
-                    mqtt_root=mqttRoot,
-                )
-            )
-    if devicetype == "counter":
-        # Create sensors for counters, for example EVU
-        SENSORS_PER_COUNTER_CP = copy.deepcopy(SENSORS_PER_COUNTER)
-        for description in SENSORS_PER_COUNTER_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
-            )
-            sensorList.append(
-                openwbSensor(
-                    uniqueID=f"{integrationUniqueID}",
-                    description=description,
-                    device_friendly_name=f"Counter {deviceID}",
-                    mqtt_root=mqttRoot,
-                )
-            )
-
-    if devicetype == "bat":
-        # Create sensors for batteries
-        SENSORS_PER_BATTERY_CP = copy.deepcopy(SENSORS_PER_BATTERY)
-        for description in SENSORS_PER_BATTERY_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in SENSORS_CONTROLLER:
+            description = dataclasses.replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{description.key}",
             )
             sensorList.append(
                 openwbSensor(
                     uniqueID=f"{integrationUniqueID}",
                     description=description,
-                    device_friendly_name=f"Battery {deviceID}",
+                    device_friendly_name=MANUFACTURER,
                     mqtt_root=mqttRoot,
                 )
             )
 
-    if devicetype == "pv":
-        # Create sensors for batteries
-        SENSORS_PER_PVGENERATOR_CP = copy.deepcopy(SENSORS_PER_PVGENERATOR)
-        for description in SENSORS_PER_PVGENERATOR_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+    if devicetype in _SENSORS_PER_DEVICETYPE:
+        descriptions, deviceName, topicInfix = _SENSORS_PER_DEVICETYPE[devicetype]
+        for description in descriptions:
+            description = dataclasses.replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{topicInfix}{description.key}",
             )
             sensorList.append(
                 openwbSensor(
                     uniqueID=f"{integrationUniqueID}",
                     description=description,
-                    device_friendly_name=f"PV {deviceID}",
+                    device_friendly_name=f"{deviceName} {deviceID}",
                     mqtt_root=mqttRoot,
                 )
             )
@@ -146,85 +120,80 @@ class openwbSensor(OpenWBBaseEntity, SensorEntity):
     async def async_added_to_hass(self):
         """Subscribe to MQTT events."""
 
-        @callback
-        def message_received(message):
-            """Handle new MQTT messages."""
-            self._attr_native_value = message.payload
+        # Subscribe to MQTT topic and connect callack message
+        self.async_on_remove(
+            await mqtt.async_subscribe(
+                self.hass,
+                self.entity_description.mqttTopicCurrentValue,
+                self._message_received,
+                1,
+            )
+        )
+        _LOGGER.debug(
+            "Subscribed to MQTT topic: %s",
+            self.entity_description.mqttTopicCurrentValue,
+        )
 
-            # Convert data if a conversion function is defined
-            if self.entity_description.value_fn is not None:
-                self._attr_native_value = self.entity_description.value_fn(
-                    self._attr_native_value
-                )
+    @callback
+    def _message_received(self, message):
+        """Handle new MQTT messages."""
+        self._attr_native_value = message.payload
 
-            # Map values as defined in the value map dict.
-            # First try to map integer values, then string values.
-            # If no value can be mapped, use original value without conversion.
-            if self.entity_description.valueMap is not None:
-                try:
-                    self._attr_native_value = self.entity_description.valueMap.get(
-                        int(self._attr_native_value)
-                    )
-                except ValueError:
-                    self._attr_native_value = self.entity_description.valueMap.get(
-                        self._attr_native_value, self._attr_native_value
-                    )
-
-            # If MQTT message contains IP --> set up configuration_url to visit the device
-            if "ip_adress" in self.entity_id:
-                device_registry = async_get_dev_reg(self.hass)
-                device = device_registry.async_get_device(
-                    self.device_info.get("identifiers")
-                )
-                device_registry.async_update_device(
-                    device.id,
-                    configuration_url=f"http://{message.payload}",
+        # Convert data if a conversion function is defined
+        if self.entity_description.value_fn is not None:
+            self._attr_native_value = self.entity_description.value_fn(
+                self._attr_native_value
+            )
+
+        # Map values as defined in the value map dict.
+        # First try to map integer values, then string values.
+        # If no value can be mapped, use original value without conversion.
+        if self.entity_description.valueMap is not None:
+            try:
+                self._attr_native_value = self.entity_description.valueMap.get(
+                    int(self._attr_native_value)
                 )
-            # If MQTT message contains version --> set sw_version of the device
-            if "version" in self.entity_id:
-                device_registry = async_get_dev_reg(self.hass)
-                device = device_registry.async_get_device(
-                    self.device_info.get("identifiers")
+            except ValueError:
+                self._attr_native_value = self.entity_description.valueMap.get(
+                    self._attr_native_value, self._attr_native_value
                 )
+
+        # If MQTT message contains IP --> set up configuration_url to visit the device
+        if "ip_adress" in self.entity_id:
+            device_registry = async_get_dev_reg(self.hass)
+            device = device_registry.async_get_device(
+                self.device_info.get("identifiers")
+            )
+            device_registry.async_update_device(
+                device.id,
+                configuration_url=f"http://{message.payload}",
+            )
+        # If MQTT message contains version --> set sw_version of the device
+        if "version" in self.entity_id:
+            device_registry = async_get_dev_reg(self.hass)
+            device = device_registry.async_get_device(
+                self.device_info.get("identifiers")
+            )
+            device_registry.async_update_device(
+                device.id, sw_version=message.payload
+            )
+
+        if "ladepunkt" in self.entity_id:
+            device_registry = async_get_dev_reg(self.hass)
+            device = device_registry.async_get_device(
+                self.device_info.get("identifiers")
+            )
+            # value_fn has already extracted the chargepoint name
+            if device is not None and self._attr_native_value is not None:
                 device_registry.async_update_device(
-                    device.id, sw_version=message.payload
+                    device.id, name=self._attr_native_value
                 )
 
-            if "ladepunkt" in self.entity_id:
-                device_registry = async_get_dev_reg(self.hass)
-                device = device_registry.async_get_device(
-                    self.device_info.get("identifiers")
-                )
-                try:
-                    device_registry.async_update_device(
-                        device.id,
-                        name=json.loads(message.payload).get("name").replace('"', ""),
-                    )
-                except:
-                    NotImplemented
-
-            # Update icon of countPhasesInUse
-            if "phases_in_use" in self.entity_description.key:
-                if int(message.payload) == 0:
-                    self._attr_icon = "mdi:numeric-0-circle-outline"
-                elif int(message.payload) == 1:
-                    self._attr_icon = "mdi:numeric-1-circle-outline"
-                elif int(message.payload) == 3:
-                    self._attr_icon = "mdi:numeric-3-circle-outline"
-                else:
-                    self._attr_icon = "mdi:numeric"
-
-            # Update entity state with value published on MQTT.
-            self.async_write_ha_state()
+        # Update icon of countPhasesInUse
+        if "phases_in_use" in self.entity_description.key:
+            self._attr_icon = _PHASES_IN_USE_ICONS.get(
+                int(message.payload), "mdi:numeric"
+            )
 
-        # Subscribe to MQTT topic and connect callack message
-        await mqtt.async_subscribe(
-            self.hass,
-            self.entity_description.mqttTopicCurrentValue,
-            message_received,
-            1,
-        )
-        _LOGGER.debug(
-            "Subscribed to MQTT topic: %s",
-            self.entity_description.mqttTopicCurrentValue,
-        )
+        # Update entity state with value published on MQTT.
+        self.async_write_ha_state()